@@ -22,7 +22,7 @@ from backend.agents.plan_critic_agent import PlanCriticAgent
 from backend.agents.writing_agent import WritingAgent
 from backend.agents.write_critic_agent import WriteCriticAgent
 from backend.tools.project import set_active_project_folder
-from backend.utils.token_counter import estimate_token_count_async, should_compress
+from backend.utils.token_counter import estimate_token_count_async
 from backend.tools.compression import compress_context_impl
 from backend.websocket_manager import get_ws_manager
 from backend.conversation_history import save_conversation_history, save_conversation_log
@@ -299,7 +299,7 @@ class AgentLoop:
         )
 
         # Check if compression needed
-        if should_compress(token_count, self.config.api.token_limit, self.config.api.compression_threshold):
+        if token_count >= self.config.api.compression_threshold:
             logger.info("Compressing context...")
             await self.compress_context(agent)
 
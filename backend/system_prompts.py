@@ -38,6 +38,8 @@ Your workflow:
 4. Use `create_plot_outline` to break down the story into manageable writing chunks
 5. Use `finalize_plan` when all planning materials are complete
 
+If you have drafted all four documents up front, you can save them together with `create_full_plan` instead of steps 1-4.
+
 Each planning file should be COMPREHENSIVE and DETAILED. These materials will guide the writing process, so they must be thorough and well-thought-out.
 
 Remember: A good plan is the foundation of great writing."""
@@ -5,7 +5,7 @@ This module provides a base class for all tools with OpenAI function calling
 format conversion.
 """
 
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, ClassVar
 from abc import ABC, abstractmethod
 
 
@@ -31,23 +31,11 @@ class BaseTool(ABC):
             if not hasattr(self, attr):
                 raise ValueError(f"Tool must define '{attr}' attribute")
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Tool name."""
-        pass
-
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Tool description."""
-        pass
-
-    @property
-    @abstractmethod
-    def parameters(self) -> Dict[str, Any]:
-        """OpenAI function parameters schema."""
-        pass
+    # Tool metadata, declared by subclasses as class attributes so the
+    # schema is built once per class (a property also satisfies these)
+    name: ClassVar[str]
+    description: ClassVar[str]
+    parameters: ClassVar[Dict[str, Any]]
 
     @abstractmethod
     def execute(self, **kwargs) -> Dict[str, Any]:
@@ -6,46 +6,112 @@ story blueprints including summary, characters, structure, and outline.
 """
 
 import os
+import re
+import shutil
 import logging
 from typing import Dict, Any, Optional
 
 from backend.tools.base_tool import BaseTool
-from backend.tools.project import get_active_project_folder
+from backend.tools.project import get_active_project_folder, get_plan_path, PLAN_FILES
 from backend.state_manager import NovelState, save_state, update_phase
 from backend.config import Phase
-from backend.utils.file_writer import atomic_write, validate_content
+from backend.utils.file_cache import invalidate
+from backend.utils.file_writer import atomic_write, validate_content, count_words
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_COUNT_RE = re.compile(r'(\d+)\s+chunks?', re.IGNORECASE)
+
+
+def _ok(message: str, file_path: str, next_step: str) -> Dict[str, Any]:
+    """
+    Build the success result shared by the planning document tools.
+
+    Args:
+        message: Status message
+        file_path: Path of the written file
+        next_step: Hint for the agent's next tool call
+
+    Returns:
+        Tool result dictionary
+    """
+    return {
+        "success": True,
+        "message": message,
+        "file_path": file_path,
+        "next_step": next_step
+    }
+
+
+def _write_plan_doc(
+    key: str,
+    content: bytes,
+    state: Optional[NovelState],
+    message: str,
+    next_step: str,
+    label: str
+) -> Dict[str, Any]:
+    """
+    Write a planning document into the active project and record it in state.
+
+    Args:
+        key: Planning document key (see PLAN_FILES)
+        content: Encoded document content
+        state: Optional novel state to update
+        message: Success message
+        next_step: Hint for the agent's next tool call
+        label: Document name used in error messages
+
+    Returns:
+        Tool result dictionary
+    """
+    file_path = get_plan_path(key)
+    if not file_path:
+        return {
+            "success": False,
+            "message": "Error: No active project folder. Create project first."
+        }
+
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        invalidate(file_path)
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Error creating {label}: {str(e)}"
+        }
+
+    # Update state (persisted by the agent loop after this iteration)
+    if state:
+        state.plan_files_created[PLAN_FILES[key]] = True
+
+    return _ok(message, file_path, next_step)
+
 
 class CreateStorySummaryTool(BaseTool):
     """Tool for creating the high-level story summary."""
 
-    @property
-    def name(self) -> str:
-        return "create_story_summary"
+    name = "create_story_summary"
 
-    @property
-    def description(self) -> str:
-        return """Creates the high-level story summary file. This should include the core concept, \
+    description = """Creates the high-level story summary file. This should include the core concept, \
 main themes, central conflict, and narrative arc. This is the foundational planning document."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_name": {
-                    "type": "string",
-                    "description": "The title/name of the novel project"
-                },
-                "summary_text": {
-                    "type": "string",
-                    "description": "The complete story summary including concept, themes, conflict, and arc"
-                }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project_name": {
+                "type": "string",
+                "description": "The title/name of the novel project"
             },
-            "required": ["project_name", "summary_text"]
-        }
+            "summary_text": {
+                "type": "string",
+                "description": "The complete story summary including concept, themes, conflict, and arc"
+            }
+        },
+        "required": ["project_name", "summary_text"]
+    }
 
     def execute(
         self,
@@ -64,8 +130,8 @@ main themes, central conflict, and narrative arc. This is the foundational plann
         Returns:
             Tool result dictionary
         """
-        project_folder = get_active_project_folder()
-        if not project_folder:
+        file_path = get_plan_path("summary")
+        if not file_path:
             return {
                 "success": False,
                 "message": "Error: No active project folder. Create project first."
@@ -74,33 +140,28 @@ main themes, central conflict, and narrative arc. This is the foundational plann
         # Prepare content
         content = f"# {project_name}\n\n## Story Summary\n\n{summary_text}\n"
 
-        # Validate content
-        is_valid, error_msg = validate_content(content, min_words=50)
+        # Validate content (word count is reused for the status message)
+        word_count = count_words(content)
+        is_valid, error_msg = validate_content(content, min_words=50, word_count=word_count)
         if not is_valid:
             return {
                 "success": False,
                 "message": f"Content validation failed: {error_msg}"
             }
 
-        # Create file in planning directory
-        file_path = os.path.join(project_folder, "planning", "summary.md")
-
         try:
             # Use atomic write for safety
             atomic_write(file_path, content, backup=False)  # No backup for new files
 
-            # Update state
+            # Update state (persisted by the agent loop after this iteration)
             if state:
-                state.plan_files_created['planning/summary.md'] = True
-                save_state(state)
+                state.plan_files_created[PLAN_FILES['summary']] = True
 
-            word_count = len(content.split())
-            return {
-                "success": True,
-                "message": f"Successfully created story summary in planning/summary.md ({word_count} words)",
-                "file_path": file_path,
-                "next_step": "Now create the dramatis personae (character profiles) using create_dramatis_personae"
-            }
+            return _ok(
+                f"Successfully created story summary in planning/summary.md ({word_count} words)",
+                file_path,
+                "Now create the dramatis personae (character profiles) using create_dramatis_personae"
+            )
 
         except ValueError as e:
             return {
@@ -108,13 +169,13 @@ main themes, central conflict, and narrative arc. This is the foundational plann
                 "message": f"Validation error: {str(e)}"
             }
         except IOError as e:
-            logger.error(f"IO error creating summary: {e}", exc_info=True)
+            logger.error("IO error creating summary: %s", e, exc_info=True)
             return {
                 "success": False,
                 "message": f"Failed to write file: {str(e)}"
             }
         except Exception as e:
-            logger.error(f"Unexpected error creating summary: {e}", exc_info=True)
+            logger.error("Unexpected error creating summary: %s", e, exc_info=True)
             return {
                 "success": False,
                 "message": f"Error creating summary: {str(e)}"
@@ -124,27 +185,21 @@ main themes, central conflict, and narrative arc. This is the foundational plann
 class CreateDramatisPersonaeTool(BaseTool):
     """Tool for creating character profiles."""
 
-    @property
-    def name(self) -> str:
-        return "create_dramatis_personae"
+    name = "create_dramatis_personae"
 
-    @property
-    def description(self) -> str:
-        return """Creates the character profiles file (dramatis personae). Include all major and \
+    description = """Creates the character profiles file (dramatis personae). Include all major and \
 significant minor characters with their backgrounds, motivations, relationships, and character arcs."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "characters_data": {
-                    "type": "string",
-                    "description": "Complete character profiles in markdown format with all major and significant minor characters"
-                }
-            },
-            "required": ["characters_data"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "characters_data": {
+                "type": "string",
+                "description": "Complete character profiles in markdown format with all major and significant minor characters"
+            }
+        },
+        "required": ["characters_data"]
+    }
 
     def execute(
         self,
@@ -161,65 +216,34 @@ significant minor characters with their backgrounds, motivations, relationships,
         Returns:
             Tool result dictionary
         """
-        project_folder = get_active_project_folder()
-        if not project_folder:
-            return {
-                "success": False,
-                "message": "Error: No active project folder. Create project first."
-            }
-
-        file_path = os.path.join(project_folder, "planning", "characters.md")
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Dramatis Personae\n\n")
-                f.write(characters_data)
-                f.write("\n")
-
-            # Update state
-            if state:
-                state.plan_files_created['planning/characters.md'] = True
-                save_state(state)
-
-            return {
-                "success": True,
-                "message": f"Successfully created character profiles in planning/characters.md",
-                "file_path": file_path,
-                "next_step": "Now create the story structure using create_story_structure"
-            }
-
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"Error creating characters: {str(e)}"
-            }
+        return _write_plan_doc(
+            "characters",
+            f"# Dramatis Personae\n\n{characters_data}\n".encode('utf-8'),
+            state,
+            "Successfully created character profiles in planning/characters.md",
+            "Now create the story structure using create_story_structure",
+            "characters"
+        )
 
 
 class CreateStoryStructureTool(BaseTool):
     """Tool for defining narrative structure."""
 
-    @property
-    def name(self) -> str:
-        return "create_story_structure"
+    name = "create_story_structure"
 
-    @property
-    def description(self) -> str:
-        return """Creates the story structure file. Define POV (point of view), narrative timeline, \
+    description = """Creates the story structure file. Define POV (point of view), narrative timeline, \
 chunk count, pacing strategy, and structural elements (acts, parts, etc.)."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "structure_data": {
-                    "type": "string",
-                    "description": "Complete structure information including POV, timeline, chunk count, and pacing"
-                }
-            },
-            "required": ["structure_data"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "structure_data": {
+                "type": "string",
+                "description": "Complete structure information including POV, timeline, chunk count, and pacing"
+            }
+        },
+        "required": ["structure_data"]
+    }
 
     def execute(
         self,
@@ -236,72 +260,43 @@ chunk count, pacing strategy, and structural elements (acts, parts, etc.)."""
         Returns:
             Tool result dictionary
         """
-        project_folder = get_active_project_folder()
-        if not project_folder:
-            return {
-                "success": False,
-                "message": "Error: No active project folder. Create project first."
-            }
-
-        file_path = os.path.join(project_folder, "planning", "structure.md")
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Story Structure\n\n")
-                f.write(structure_data)
-                f.write("\n")
-
-            # Extract chunk count if mentioned (for state tracking)
-            # Simple heuristic: look for "X chunks" pattern
-            import re
-            chunk_match = re.search(r'(\d+)\s+chunks?', structure_data, re.IGNORECASE)
-            if chunk_match and state:
+        result = _write_plan_doc(
+            "structure",
+            f"# Story Structure\n\n{structure_data}\n".encode('utf-8'),
+            state,
+            "Successfully created story structure in planning/structure.md",
+            "Now create the detailed plot outline using create_plot_outline",
+            "structure"
+        )
+
+        # Extract chunk count if mentioned (for state tracking)
+        # Simple heuristic: look for "X chunks" pattern
+        if result["success"] and state:
+            chunk_match = _CHUNK_COUNT_RE.search(structure_data)
+            if chunk_match:
                 state.total_chunks = int(chunk_match.group(1))
 
-            # Update state
-            if state:
-                state.plan_files_created['planning/structure.md'] = True
-                save_state(state)
-
-            return {
-                "success": True,
-                "message": f"Successfully created story structure in planning/structure.md",
-                "file_path": file_path,
-                "next_step": "Now create the detailed plot outline using create_plot_outline"
-            }
-
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"Error creating structure: {str(e)}"
-            }
+        return result
 
 
 class CreatePlotOutlineTool(BaseTool):
     """Tool for creating chunk-by-chunk plot outline."""
 
-    @property
-    def name(self) -> str:
-        return "create_plot_outline"
+    name = "create_plot_outline"
 
-    @property
-    def description(self) -> str:
-        return """Creates the detailed plot outline file. Break down the story chunk by chunk \
+    description = """Creates the detailed plot outline file. Break down the story chunk by chunk \
 with key events, character moments, plot developments, and how each chunk advances the narrative."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "outline_data": {
-                    "type": "string",
-                    "description": "Complete chunk-by-chunk plot outline in markdown format"
-                }
-            },
-            "required": ["outline_data"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "outline_data": {
+                "type": "string",
+                "description": "Complete chunk-by-chunk plot outline in markdown format"
+            }
+        },
+        "required": ["outline_data"]
+    }
 
     def execute(
         self,
@@ -315,6 +310,75 @@ with key events, character moments, plot developments, and how each chunk advanc
             outline_data: Plot outline in markdown format
             state: Optional novel state to update
 
+        Returns:
+            Tool result dictionary
+        """
+        return _write_plan_doc(
+            "outline",
+            f"# Plot Outline\n\n{outline_data}\n".encode('utf-8'),
+            state,
+            "Successfully created plot outline in planning/outline.md",
+            "Now finalize the plan using finalize_plan to complete the planning phase",
+            "outline"
+        )
+
+
+class CreateFullPlanTool(BaseTool):
+    """Tool for creating all four planning documents in a single call."""
+
+    name = "create_full_plan"
+
+    description = """Creates all four planning documents (summary, characters, structure, outline) \
+in one call. Prefer this over the individual create_* tools once every document is drafted: it saves a \
+round-trip per document, and either all files are written or none are."""
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project_name": {
+                "type": "string",
+                "description": "The title/name of the novel project"
+            },
+            "summary_text": {
+                "type": "string",
+                "description": "The complete story summary including concept, themes, conflict, and arc"
+            },
+            "characters_data": {
+                "type": "string",
+                "description": "Complete character profiles in markdown format with all major and significant minor characters"
+            },
+            "structure_data": {
+                "type": "string",
+                "description": "Complete structure information including POV, timeline, chunk count, and pacing"
+            },
+            "outline_data": {
+                "type": "string",
+                "description": "Complete chunk-by-chunk plot outline in markdown format"
+            }
+        },
+        "required": ["project_name", "summary_text", "characters_data", "structure_data", "outline_data"]
+    }
+
+    def execute(
+        self,
+        project_name: str,
+        summary_text: str,
+        characters_data: str,
+        structure_data: str,
+        outline_data: str,
+        state: Optional[NovelState] = None
+    ) -> Dict[str, Any]:
+        """
+        Creates all planning documents.
+
+        Args:
+            project_name: The title/name of the novel
+            summary_text: The complete summary text
+            characters_data: Character profiles in markdown format
+            structure_data: Structure information in markdown format
+            outline_data: Plot outline in markdown format
+            state: Optional novel state to update
+
         Returns:
             Tool result dictionary
         """
@@ -325,58 +389,123 @@ with key events, character moments, plot developments, and how each chunk advanc
                 "message": "Error: No active project folder. Create project first."
             }
 
-        file_path = os.path.join(project_folder, "planning", "outline.md")
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Plot Outline\n\n")
-                f.write(outline_data)
-                f.write("\n")
+        summary = f"# {project_name}\n\n## Story Summary\n\n{summary_text}\n"
 
-            # Update state
-            if state:
-                state.plan_files_created['planning/outline.md'] = True
-                save_state(state)
+        # Validate every document before touching the filesystem
+        checks = [
+            ('summary', summary, 50),
+            ('characters', characters_data, 0),
+            ('structure', structure_data, 0),
+            ('outline', outline_data, 0)
+        ]
+        for label, text, min_words in checks:
+            is_valid, error_msg = validate_content(text, min_words=min_words)
+            if not is_valid:
+                return {
+                    "success": False,
+                    "message": f"Content validation failed for {label}: {error_msg}"
+                }
 
-            return {
-                "success": True,
-                "message": f"Successfully created plot outline in planning/outline.md",
-                "file_path": file_path,
-                "next_step": "Now finalize the plan using finalize_plan to complete the planning phase"
-            }
+        documents = [
+            ("summary", summary),
+            ("characters", f"# Dramatis Personae\n\n{characters_data}\n"),
+            ("structure", f"# Story Structure\n\n{structure_data}\n"),
+            ("outline", f"# Plot Outline\n\n{outline_data}\n")
+        ]
 
+        # Stage every file next to its target, keep a hard-linked backup of
+        # each existing document, then move the staged files into place. If
+        # any step fails, documents already replaced are restored from their
+        # backups, so the existing plan is left untouched
+        staged = []
+        backups = {}
+        replaced = []
+        try:
+            os.makedirs(os.path.join(project_folder, "planning"), exist_ok=True)
+            for key, text in documents:
+                file_path = get_plan_path(key)
+                tmp_path = file_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    staged.append((tmp_path, file_path))
+                    f.write(text.encode('utf-8'))
+            for _, file_path in staged:
+                backup_path = file_path + ".bak"
+                try:
+                    os.unlink(backup_path)
+                except FileNotFoundError:
+                    pass
+                try:
+                    os.link(file_path, backup_path)
+                except FileNotFoundError:
+                    continue  # New document, nothing to restore
+                except OSError:
+                    # e.g. filesystem without hard links; fall back to a copy
+                    shutil.copy2(file_path, backup_path)
+                backups[file_path] = backup_path
+            for tmp_path, file_path in staged:
+                os.replace(tmp_path, file_path)
+                replaced.append(file_path)
+                invalidate(file_path)
         except Exception as e:
+            for file_path in replaced:
+                try:
+                    if file_path in backups:
+                        os.replace(backups.pop(file_path), file_path)
+                    else:
+                        os.remove(file_path)
+                except OSError:
+                    pass
+                invalidate(file_path)
+            for tmp_path, _ in staged:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return {
                 "success": False,
-                "message": f"Error creating outline: {str(e)}"
+                "message": f"Error creating plan: {str(e)}"
             }
+        finally:
+            for backup_path in backups.values():
+                try:
+                    os.remove(backup_path)
+                except OSError:
+                    pass
+
+        # Update state (persisted by the agent loop after this iteration)
+        if state:
+            for key, _ in documents:
+                state.plan_files_created[PLAN_FILES[key]] = True
+            chunk_match = _CHUNK_COUNT_RE.search(structure_data)
+            if chunk_match:
+                state.total_chunks = int(chunk_match.group(1))
+
+        return {
+            "success": True,
+            "message": "Successfully created all planning documents in planning/ (summary, characters, structure, outline)",
+            "files_created": [PLAN_FILES[key] for key, _ in documents],
+            "next_step": "Now finalize the plan using finalize_plan to complete the planning phase"
+        }
 
 
 class FinalizePlanTool(BaseTool):
     """Tool for finalizing the planning phase."""
 
-    @property
-    def name(self) -> str:
-        return "finalize_plan"
+    name = "finalize_plan"
 
-    @property
-    def description(self) -> str:
-        return """Finalizes the planning phase. Call this after creating all planning documents \
+    description = """Finalizes the planning phase. Call this after creating all planning documents \
 (summary, characters, structure, outline). This transitions the project to the plan critique phase."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "notes": {
-                    "type": "string",
-                    "description": "Optional notes about the completed plan"
-                }
-            },
-            "required": []
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "notes": {
+                "type": "string",
+                "description": "Optional notes about the completed plan"
+            }
+        },
+        "required": []
+    }
 
     def execute(
         self,
@@ -401,18 +530,19 @@ class FinalizePlanTool(BaseTool):
             }
 
         # Verify all required planning files exist
-        required_files = [
-            'planning/summary.md',
-            'planning/characters.md',
-            'planning/structure.md',
-            'planning/outline.md'
-        ]
+        required_files = list(PLAN_FILES.values())
 
-        missing_files = []
-        for file in required_files:
-            file_path = os.path.join(project_folder, file)
-            if not os.path.exists(file_path):
-                missing_files.append(file)
+        # One directory read instead of a stat per required file
+        try:
+            with os.scandir(os.path.join(project_folder, "planning")) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+
+        missing_files = [
+            file for file in required_files
+            if os.path.basename(file) not in present
+        ]
 
         if missing_files:
             return {
@@ -441,13 +571,18 @@ class FinalizePlanTool(BaseTool):
         }
 
 
-# Registry of all planning tools
+# Registry of all planning tools (tools are stateless, so instances are
+# built once and shared)
+PLANNING_TOOLS = [
+    CreateStorySummaryTool(),
+    CreateDramatisPersonaeTool(),
+    CreateStoryStructureTool(),
+    CreatePlotOutlineTool(),
+    CreateFullPlanTool(),
+    FinalizePlanTool()
+]
+
+
 def get_planning_tools():
     """Get all planning phase tools."""
-    return [
-        CreateStorySummaryTool(),
-        CreateDramatisPersonaeTool(),
-        CreateStoryStructureTool(),
-        CreatePlotOutlineTool(),
-        FinalizePlanTool()
-    ]
+    return list(PLANNING_TOOLS)
@@ -6,14 +6,49 @@ Migrated from tools/project.py with updates for multi-agent architecture.
 
 import os
 import re
+from contextvars import ContextVar
 from typing import Optional, Dict, Any
 
 from backend.tools.base_tool import BaseTool
 from backend.state_manager import NovelState, save_state
 
 
-# Global variable to track the active project folder
-_active_project_folder: Optional[str] = None
+# Active project folder, tracked per context so concurrent generation
+# tasks (one asyncio task per project) don't see each other's folder
+_active_project_folder: ContextVar[Optional[str]] = ContextVar(
+    "active_project_folder", default=None
+)
+
+# Output directory paths, resolved once at import
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ROOT_DIR = os.path.dirname(_BACKEND_DIR)
+_OUTPUT_DIR = os.path.join(_ROOT_DIR, "output")
+
+# Folder name sanitization: spaces become underscores, and anything that
+# isn't alphanumeric, underscore, or hyphen is removed
+_SANITIZE_TABLE = {
+    c: None for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in '_-')
+}
+_SANITIZE_TABLE[ord(' ')] = '_'
+_BAD_CHARS_RE = re.compile(r'[^\w\-]')
+
+# Subdirectories every project folder contains
+_PROJECT_SUBDIRS = frozenset(('planning', 'manuscript', 'critiques'))
+
+# Planning documents, relative to the project folder
+PLAN_FILES = {
+    "summary": "planning/summary.md",
+    "characters": "planning/characters.md",
+    "structure": "planning/structure.md",
+    "outline": "planning/outline.md"
+}
+
+# Absolute planning document paths per project folder, joined once
+_plan_paths: Dict[str, Dict[str, str]] = {}
+
+# Absolute subdirectory paths per project folder, joined once
+_subdir_paths: Dict[str, Dict[str, str]] = {}
 
 
 def sanitize_folder_name(name: str) -> str:
@@ -26,10 +61,11 @@ def sanitize_folder_name(name: str) -> str:
     Returns:
         Sanitized folder name
     """
-    # Replace spaces with underscores
-    name = name.strip().replace(' ', '_')
-    # Remove any characters that aren't alphanumeric, underscore, or hyphen
-    name = re.sub(r'[^\w\-]', '', name)
+    # Replace spaces with underscores and drop disallowed ASCII in one pass
+    name = name.strip().translate(_SANITIZE_TABLE)
+    # Non-ASCII input may still hold characters that aren't word characters
+    if not name.isascii():
+        name = _BAD_CHARS_RE.sub('', name)
     # Remove leading/trailing hyphens or underscores
     name = name.strip('-_')
     # Ensure it's not empty
@@ -42,10 +78,13 @@ def get_active_project_folder() -> Optional[str]:
     """
     Returns the currently active project folder path.
 
+    This is a plain context variable read (no disk or config access), so
+    tools call it directly at the start of every execute().
+
     Returns:
         Path to active project folder or None if not set
     """
-    return _active_project_folder
+    return _active_project_folder.get()
 
 
 def set_active_project_folder(folder_path: str) -> None:
@@ -55,34 +94,119 @@ def set_active_project_folder(folder_path: str) -> None:
     Args:
         folder_path: Path to the project folder
     """
-    global _active_project_folder
-    _active_project_folder = folder_path
+    _active_project_folder.set(folder_path)
+    _cache_plan_paths(folder_path)
+
+
+def _cache_plan_paths(folder_path: str) -> Dict[str, str]:
+    """
+    Build (once per folder) the planning document paths for a project.
+
+    Args:
+        folder_path: Path to the project folder
+
+    Returns:
+        Mapping of planning document key to file path
+    """
+    paths = _plan_paths.get(folder_path)
+    if paths is None:
+        paths = {
+            key: os.path.join(folder_path, relpath)
+            for key, relpath in PLAN_FILES.items()
+        }
+        _plan_paths[folder_path] = paths
+    return paths
+
+
+def get_plan_path(key: str) -> Optional[str]:
+    """
+    Returns the path of a planning document in the active project.
+
+    Args:
+        key: Planning document key (summary, characters, structure, outline)
+
+    Returns:
+        Path to the planning document or None if no project is active
+    """
+    folder_path = _active_project_folder.get()
+    if not folder_path:
+        return None
+    return _cache_plan_paths(folder_path)[key]
+
+
+def get_project_dir(subdir: str) -> Optional[str]:
+    """
+    Returns the path of a subdirectory of the active project.
+
+    Args:
+        subdir: Subdirectory name (planning, manuscript, critiques)
+
+    Returns:
+        Path to the subdirectory or None if no project is active
+    """
+    folder_path = _active_project_folder.get()
+    if not folder_path:
+        return None
+    paths = _subdir_paths.get(folder_path)
+    if paths is None:
+        paths = {name: os.path.join(folder_path, name) for name in _PROJECT_SUBDIRS}
+        _subdir_paths[folder_path] = paths
+    return paths[subdir]
+
+
+def _existing_subdirs(project_path: str) -> set:
+    """
+    List the subdirectory names of a project folder with one directory read.
+
+    Args:
+        project_path: Path to the project folder
+
+    Returns:
+        Set of subdirectory names (empty if the folder doesn't exist)
+    """
+    try:
+        with os.scandir(project_path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _project_ready(project_path: str) -> Dict[str, Any]:
+    """
+    Build the success result for CreateProjectTool.
+
+    Args:
+        project_path: Path to the project folder
+
+    Returns:
+        Tool result dictionary
+    """
+    return {
+        "success": True,
+        "message": f"Project folder ready at '{project_path}'. Subdirectories (planning, manuscript, critiques) ensured.",
+        "project_path": project_path,
+        "project_name": os.path.basename(project_path)
+    }
 
 
 class CreateProjectTool(BaseTool):
     """Tool for creating project folders."""
 
-    @property
-    def name(self) -> str:
-        return "create_project"
+    name = "create_project"
 
-    @property
-    def description(self) -> str:
-        return """Creates a new project folder in the 'output' directory with a sanitized name. \
+    description = """Creates a new project folder in the 'output' directory with a sanitized name. \
 This should be called first before writing any files. Only one project can be active at a time."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_name": {
-                    "type": "string",
-                    "description": "The name for the project folder (will be sanitized for filesystem compatibility)"
-                }
-            },
-            "required": ["project_name"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "project_name": {
+                "type": "string",
+                "description": "The name for the project folder (will be sanitized for filesystem compatibility)"
+            }
+        },
+        "required": ["project_name"]
+    }
 
     def execute(self, project_name: str, state: Optional[NovelState] = None) -> Dict[str, Any]:
         """
@@ -98,61 +222,50 @@ This should be called first before writing any files. Only one project can be ac
         Returns:
             Tool result dictionary
         """
-        global _active_project_folder
-
         # If we have a state with project_id, use that folder instead
         if state and state.project_id:
-            # Get the backend directory
-            backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            root_dir = os.path.dirname(backend_dir)
-            output_dir = os.path.join(root_dir, "output")
-
             # Use the project_id as the folder name (already created)
-            project_path = os.path.join(output_dir, state.project_id)
+            project_path = os.path.join(_OUTPUT_DIR, state.project_id)
 
             # Don't change the active folder if it's already set correctly
-            if _active_project_folder and os.path.normpath(_active_project_folder) == os.path.normpath(project_path):
+            active_folder = _active_project_folder.get()
+            if active_folder and os.path.normpath(active_folder) == os.path.normpath(project_path):
                 pass  # Already correct
             else:
-                _active_project_folder = project_path
+                set_active_project_folder(project_path)
         else:
             # Fallback to original behavior if no state (shouldn't happen in multi-agent mode)
             sanitized_name = sanitize_folder_name(project_name)
-            backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            root_dir = os.path.dirname(backend_dir)
-            output_dir = os.path.join(root_dir, "output")
-            project_path = os.path.join(output_dir, sanitized_name)
-            _active_project_folder = project_path
+            project_path = os.path.join(_OUTPUT_DIR, sanitized_name)
+            set_active_project_folder(project_path)
+
+        # Common case: project was set up at session start, nothing to create
+        if _PROJECT_SUBDIRS <= _existing_subdirs(project_path):
+            return _project_ready(project_path)
 
         # Ensure project folder exists
-        if not os.path.exists(project_path):
+        try:
+            os.makedirs(project_path, exist_ok=True)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error creating project folder: {str(e)}"
+            }
+
+        # Create subdirectories for organization (parent exists, so a plain
+        # mkdir is enough and avoids a separate existence check)
+        for subdir in _PROJECT_SUBDIRS:
             try:
-                os.makedirs(project_path, exist_ok=True)
+                os.mkdir(os.path.join(project_path, subdir))
+            except FileExistsError:
+                pass
             except Exception as e:
                 return {
                     "success": False,
-                    "message": f"Error creating project folder: {str(e)}"
+                    "message": f"Error creating subdirectory '{subdir}': {str(e)}"
                 }
 
-        # Create subdirectories for organization
-        subdirs = ['planning', 'manuscript', 'critiques']
-        for subdir in subdirs:
-            subdir_path = os.path.join(project_path, subdir)
-            if not os.path.exists(subdir_path):
-                try:
-                    os.makedirs(subdir_path, exist_ok=True)
-                except Exception as e:
-                    return {
-                        "success": False,
-                        "message": f"Error creating subdirectory '{subdir}': {str(e)}"
-                    }
-
-        return {
-            "success": True,
-            "message": f"Project folder ready at '{project_path}'. Subdirectories (planning, manuscript, critiques) ensured.",
-            "project_path": project_path,
-            "project_name": os.path.basename(project_path)
-        }
+        return _project_ready(project_path)
 
 
 # For backward compatibility
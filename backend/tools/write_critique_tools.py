@@ -5,40 +5,116 @@ These tools are used during Phase 4 (WRITE_CRITIQUE) to review and critique
 individual chunks, ensuring quality before moving forward.
 """
 
+import io
 import os
-from typing import Dict, Any, Optional
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from backend.tools.base_tool import BaseTool
-from backend.tools.project import get_active_project_folder
+from backend.tools.project import get_active_project_folder, get_plan_path, get_project_dir
 from backend.state_manager import NovelState, save_state, update_phase, increment_chunk
+from backend.utils.file_cache import read_cached, prefetch
+from backend.utils.file_writer import count_words, write_parts
 from backend.config import Phase
 
 
+# Separator line used to frame loaded file content
+_SEP = "=" * 80
+
+# Headers for saved critique, approval, and revision files
+_CRITIQUE_HEADER = "# Chunk %d Critique - Version %d\n\n**Date:** %s\n\n---\n\n"
+_APPROVAL_HEADER = "# Chunk %d Approval\n\n**Date:** %s\n\n**Status:** APPROVED\n\n---\n\n"
+_REVISION_HEADER = (
+    "# Chunk %d Revision Request - Version %d\n\n**Date:** %s\n\n"
+    "**Status:** REVISION REQUESTED\n\n---\n\n"
+)
+
+
+# Word counts memoized per content string. read_cached() returns the same str
+# object while a chunk is unchanged, and str caches its own hash, so repeat
+# lookups are cheap
+@functools.lru_cache(maxsize=64)
+def _word_count_cached(content: str) -> int:
+    """
+    Count the words in a chunk, memoized per content.
+
+    Args:
+        content: Chunk text
+
+    Returns:
+        Word count
+    """
+    return count_words(content)
+
+
+# Directories already created by this process, so repeat saves skip makedirs
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory (and parents) once per process.
+
+    Args:
+        path: Directory to create
+    """
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# Last saved critique per (project folder, chunk): (text digest, version, path).
+# Lets CritiqueChunkTool skip rewriting a critique identical to the previous one.
+# Cleared when a revision is requested, so every critique of a revised chunk
+# gets a new version and counts toward the revision limit
+_last_critique_hash: Dict[Tuple[str, int], Tuple[bytes, int, str]] = {}
+
+
+# Single background worker for page-cache prefetch hints; work submitted here
+# is fire-and-forget and nothing waits on it
+_prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+
+def _prefetch_next_chunk_context(chunk_number: int) -> None:
+    """
+    Warm the files the writer reads when starting the chunk after an approval.
+
+    Args:
+        chunk_number: The chunk that was just approved
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    manuscript_dir = get_project_dir("manuscript")
+    _prefetch_pool.submit(prefetch, [
+        get_plan_path("outline"),
+        get_plan_path("characters"),
+        os.path.join(manuscript_dir, f"chunk_{chunk_number:02d}.md"),
+        os.path.join(manuscript_dir, f"chunk_{chunk_number + 1:02d}.md")
+    ])
+
+
 class LoadChunkForReviewTool(BaseTool):
     """Tool for loading a chunk for review."""
 
-    @property
-    def name(self) -> str:
-        return "load_chunk_for_review"
+    name = "load_chunk_for_review"
 
-    @property
-    def description(self) -> str:
-        return """Loads the specified chunk for review. Use this to read the chunk content \
+    description = """Loads the specified chunk for review. Use this to read the chunk content \
 before providing critique."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "chunk_number": {
-                    "type": "integer",
-                    "description": "The chunk number to review (1-indexed)"
-                }
-            },
-            "required": ["chunk_number"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "chunk_number": {
+                "type": "integer",
+                "description": "The chunk number to review (1-indexed)"
+            }
+        },
+        "required": ["chunk_number"]
+    }
 
     def execute(
         self,
@@ -63,25 +139,30 @@ before providing critique."""
             }
 
         filename = f"chunk_{chunk_number:02d}.md"
-        file_path = os.path.join(project_folder, "manuscript", filename)
+        file_path = os.path.join(get_project_dir("manuscript"), filename)
 
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "message": f"Chunk {chunk_number} not found."
             }
+        except OSError as e:
+            return {
+                "success": False,
+                "message": f"Error loading chunk: {str(e)}"
+            }
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            word_count = len(content.split())
+            content = read_cached(file_path, st)
+            word_count = _word_count_cached(content)
 
             formatted_content = f"""CHUNK {chunk_number} FOR REVIEW:
 
-{'='*80}
+{_SEP}
 {content}
-{'='*80}
+{_SEP}
 
 Word Count: {word_count}
 """
@@ -104,27 +185,21 @@ Word Count: {word_count}
 class LoadContextForCritiqueTool(BaseTool):
     """Tool for loading relevant context for chunk critique."""
 
-    @property
-    def name(self) -> str:
-        return "load_context_for_critique"
+    name = "load_context_for_critique"
 
-    @property
-    def description(self) -> str:
-        return """Loads relevant context for critiquing a chunk, including the plan, outline, \
+    description = """Loads relevant context for critiquing a chunk, including the plan, outline, \
 and previous chunks for continuity checking."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "chunk_number": {
-                    "type": "integer",
-                    "description": "The chunk number being critiqued"
-                }
-            },
-            "required": ["chunk_number"]
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "chunk_number": {
+                "type": "integer",
+                "description": "The chunk number being critiqued"
+            }
+        },
+        "required": ["chunk_number"]
+    }
 
     def execute(
         self,
@@ -148,45 +223,37 @@ and previous chunks for continuity checking."""
                 "message": "Error: No active project folder."
             }
 
-        context_parts = []
-
-        # Load outline
-        outline_path = os.path.join(project_folder, "planning", "outline.md")
-        if os.path.exists(outline_path):
-            try:
-                with open(outline_path, 'r', encoding='utf-8') as f:
-                    outline = f.read()
-                    context_parts.append(f"PLOT OUTLINE:\n{'='*80}\n{outline}")
-            except:
-                pass
-
-        # Load character profiles
-        chars_path = os.path.join(project_folder, "planning", "characters.md")
-        if os.path.exists(chars_path):
-            try:
-                with open(chars_path, 'r', encoding='utf-8') as f:
-                    chars = f.read()
-                    context_parts.append(f"\nCHARACTER PROFILES:\n{'='*80}\n{chars}")
-            except:
-                pass
-
-        # Load previous chunk if exists
+        # Outline, character profiles, and the previous chunk (if any). The
+        # planning documents rarely change during writing, so after the first
+        # critique they come from the file cache
+        context_files = [
+            ("PLOT OUTLINE:", get_plan_path("outline")),
+            ("\nCHARACTER PROFILES:", get_plan_path("characters"))
+        ]
         if chunk_number > 1:
             prev_filename = f"chunk_{chunk_number-1:02d}.md"
-            prev_path = os.path.join(project_folder, "manuscript", prev_filename)
-            if os.path.exists(prev_path):
-                try:
-                    with open(prev_path, 'r', encoding='utf-8') as f:
-                        prev_chunk = f.read()
-                        context_parts.append(f"\nPREVIOUS CHUNK (Chunk {chunk_number-1}):\n{'='*80}\n{prev_chunk}")
-                except:
-                    pass
+            context_files.append((
+                f"\nPREVIOUS CHUNK (Chunk {chunk_number-1}):",
+                os.path.join(get_project_dir("manuscript"), prev_filename)
+            ))
+
+        buf = io.StringIO()
+        for heading, path in context_files:
+            try:
+                text = read_cached(path)
+            except (OSError, ValueError):
+                continue  # Missing or unreadable context is skipped
+            buf.write(heading)
+            buf.write("\n")
+            buf.write(_SEP)
+            buf.write("\n")
+            buf.write(text)
 
         formatted_content = f"""CONTEXT FOR CRITIQUING CHUNK {chunk_number}:
 
-{'='*80}
-{''.join(context_parts)}
-{'='*80}
+{_SEP}
+{buf.getvalue()}
+{_SEP}
 """
 
         return {
@@ -199,31 +266,25 @@ and previous chunks for continuity checking."""
 class CritiqueChunkTool(BaseTool):
     """Tool for providing critique feedback on a chunk."""
 
-    @property
-    def name(self) -> str:
-        return "critique_chunk"
+    name = "critique_chunk"
 
-    @property
-    def description(self) -> str:
-        return """Provides detailed critique of a chunk. Document issues with plot consistency, \
+    description = """Provides detailed critique of a chunk. Document issues with plot consistency, \
 character behavior, prose quality, pacing, or adherence to the plan. This critique will be saved."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "chunk_number": {
-                    "type": "integer",
-                    "description": "The chunk number being critiqued"
-                },
-                "critique_text": {
-                    "type": "string",
-                    "description": "Detailed critique feedback"
-                }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "chunk_number": {
+                "type": "integer",
+                "description": "The chunk number being critiqued"
             },
-            "required": ["chunk_number", "critique_text"]
-        }
+            "critique_text": {
+                "type": "string",
+                "description": "Detailed critique feedback"
+            }
+        },
+        "required": ["chunk_number", "critique_text"]
+    }
 
     def execute(
         self,
@@ -249,31 +310,44 @@ character behavior, prose quality, pacing, or adherence to the plan. This critiq
                 "message": "Error: No active project folder."
             }
 
-        # Determine critique version
+        # An identical re-emitted critique keeps the previous version and file
+        critique_hash = hashlib.blake2b(critique_text.encode('utf-8'), digest_size=16).digest()
+        previous = _last_critique_hash.get((project_folder, chunk_number))
+        if (
+            previous
+            and previous[0] == critique_hash
+            and (not state or state.chunk_critique_iterations.get(chunk_number) == previous[1])
+        ):
+            _, version, file_path = previous
+            return {
+                "success": True,
+                "message": f"Critique for Chunk {chunk_number} unchanged (version {version}).",
+                "file_path": file_path,
+                "version": version,
+                "chunk_number": chunk_number,
+                "next_step": "Use approve_chunk to accept it or request_revision to send back for improvements"
+            }
+
+        # Determine critique version (persisted by the agent loop after this iteration)
         version = 1
-        if state and chunk_number in state.chunk_critique_iterations:
-            version = state.chunk_critique_iterations[chunk_number] + 1
+        if state:
+            version = state.chunk_critique_iterations.get(chunk_number, 0) + 1
             state.chunk_critique_iterations[chunk_number] = version
-        elif state:
-            state.chunk_critique_iterations[chunk_number] = 1
 
         # Save critique
-        critique_dir = os.path.join(project_folder, "critiques")
-        os.makedirs(critique_dir, exist_ok=True)
+        critique_dir = get_project_dir("critiques")
+        _ensure_dir(critique_dir)
 
         filename = f"chunk_{chunk_number:02d}_critique_v{version}.md"
         file_path = os.path.join(critique_dir, filename)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Chunk {chunk_number} Critique - Version {version}\n\n")
-                f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"---\n\n")
-                f.write(critique_text)
-                f.write("\n")
-
-            if state:
-                save_state(state)
+            write_parts(file_path, [
+                _CRITIQUE_HEADER % (chunk_number, version, datetime.now().isoformat(sep=' ', timespec='seconds')),
+                critique_text,
+                "\n"
+            ])
+            _last_critique_hash[(project_folder, chunk_number)] = (critique_hash, version, file_path)
 
             return {
                 "success": True,
@@ -294,31 +368,25 @@ character behavior, prose quality, pacing, or adherence to the plan. This critiq
 class ApproveChunkTool(BaseTool):
     """Tool for approving a chunk and moving to next chunk or completion."""
 
-    @property
-    def name(self) -> str:
-        return "approve_chunk"
+    name = "approve_chunk"
 
-    @property
-    def description(self) -> str:
-        return """Approves a chunk, marking it as complete. If there are more chunks to write, \
+    description = """Approves a chunk, marking it as complete. If there are more chunks to write, \
 transitions back to writing phase for the next chunk. If this is the last chunk, completes the novel."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "chunk_number": {
-                    "type": "integer",
-                    "description": "The chunk number being approved"
-                },
-                "approval_notes": {
-                    "type": "string",
-                    "description": "Notes about why the chunk is approved"
-                }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "chunk_number": {
+                "type": "integer",
+                "description": "The chunk number being approved"
             },
-            "required": ["chunk_number", "approval_notes"]
-        }
+            "approval_notes": {
+                "type": "string",
+                "description": "Notes about why the chunk is approved"
+            }
+        },
+        "required": ["chunk_number", "approval_notes"]
+    }
 
     def execute(
         self,
@@ -345,31 +413,30 @@ transitions back to writing phase for the next chunk. If this is the last chunk,
             }
 
         # Save approval notes
-        approval_dir = os.path.join(project_folder, "critiques")
-        os.makedirs(approval_dir, exist_ok=True)
+        approval_dir = get_project_dir("critiques")
+        _ensure_dir(approval_dir)
 
         filename = f"chunk_{chunk_number:02d}_approval.md"
         file_path = os.path.join(approval_dir, filename)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Chunk {chunk_number} Approval\n\n")
-                f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"**Status:** APPROVED\n\n")
-                f.write(f"---\n\n")
-                f.write(approval_notes)
-                f.write("\n")
+            write_parts(file_path, [
+                _APPROVAL_HEADER % (chunk_number, datetime.now().isoformat(sep=' ', timespec='seconds')),
+                approval_notes,
+                "\n"
+            ])
 
             # Update state (but don't change phase yet - let agent_loop handle that)
             is_complete = False
             next_phase_msg = ""
 
             if state:
-                # Mark chunk as completed and approved
-                if chunk_number not in state.chunks_completed:
-                    state.chunks_completed.append(chunk_number)
-                if chunk_number not in state.chunks_approved:
-                    state.chunks_approved.append(chunk_number)
+                # Mark chunk as completed and approved. These stay lists: they
+                # are part of the persisted state and API schema, and are
+                # bounded by total_chunks, so the scans are short
+                for chunk_list in (state.chunks_completed, state.chunks_approved):
+                    if chunk_number not in chunk_list:
+                        chunk_list.append(chunk_number)
 
                 # Check if novel is complete
                 if len(state.chunks_approved) >= state.total_chunks:
@@ -377,10 +444,13 @@ transitions back to writing phase for the next chunk. If this is the last chunk,
                     next_phase_msg = "All chunks complete! Novel generation finished (pending user approval if enabled)."
                 else:
                     # Move to next chunk (increment counter but don't change phase)
+                    # (persisted by the agent loop after this iteration)
                     increment_chunk(state)
+                    _prefetch_next_chunk_context(chunk_number)
                     next_phase_msg = f"Chunk {chunk_number} approved by critic. Moving to Chunk {state.current_chunk} (pending user approval if enabled)."
 
-                save_state(state)
+                if is_complete:
+                    save_state(state)
 
             return {
                 "success": True,
@@ -408,31 +478,25 @@ transitions back to writing phase for the next chunk. If this is the last chunk,
 class RequestRevisionTool(BaseTool):
     """Tool for requesting revisions to a chunk."""
 
-    @property
-    def name(self) -> str:
-        return "request_revision"
+    name = "request_revision"
 
-    @property
-    def description(self) -> str:
-        return """Requests revisions to a chunk. Sends the chunk back to the writing phase \
+    description = """Requests revisions to a chunk. Sends the chunk back to the writing phase \
 with specific revision notes. The writer will revise and resubmit the chunk."""
 
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "chunk_number": {
-                    "type": "integer",
-                    "description": "The chunk number requiring revision"
-                },
-                "revision_notes": {
-                    "type": "string",
-                    "description": "Specific notes about what needs to be revised"
-                }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "chunk_number": {
+                "type": "integer",
+                "description": "The chunk number requiring revision"
             },
-            "required": ["chunk_number", "revision_notes"]
-        }
+            "revision_notes": {
+                "type": "string",
+                "description": "Specific notes about what needs to be revised"
+            }
+        },
+        "required": ["chunk_number", "revision_notes"]
+    }
 
     def execute(
         self,
@@ -459,9 +523,9 @@ with specific revision notes. The writer will revise and resubmit the chunk."""
             }
 
         # Check iteration limit
+        current_iterations = state.chunk_critique_iterations.get(chunk_number, 0) if state else 0
         if state:
             max_iterations = 2  # Default, should come from config
-            current_iterations = state.chunk_critique_iterations.get(chunk_number, 0)
 
             if current_iterations >= max_iterations:
                 return {
@@ -471,21 +535,22 @@ with specific revision notes. The writer will revise and resubmit the chunk."""
                 }
 
         # Save revision request
-        revision_dir = os.path.join(project_folder, "critiques")
-        os.makedirs(revision_dir, exist_ok=True)
+        revision_dir = get_project_dir("critiques")
+        _ensure_dir(revision_dir)
 
-        version = state.chunk_critique_iterations.get(chunk_number, 0) if state else 0
+        version = current_iterations
         filename = f"chunk_{chunk_number:02d}_revision_request_v{version}.md"
         file_path = os.path.join(revision_dir, filename)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Chunk {chunk_number} Revision Request - Version {version}\n\n")
-                f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"**Status:** REVISION REQUESTED\n\n")
-                f.write(f"---\n\n")
-                f.write(revision_notes)
-                f.write("\n")
+            write_parts(file_path, [
+                _REVISION_HEADER % (chunk_number, version, datetime.now().isoformat(sep=' ', timespec='seconds')),
+                revision_notes,
+                "\n"
+            ])
+
+            # The next critique is of the revised chunk and must be counted
+            _last_critique_hash.pop((project_folder, chunk_number), None)
 
             # Update state - transition back to writing
             if state:
@@ -5,15 +5,129 @@ These tools are used during Phase 3 (WRITING) to write complete chunks
 based on the approved plan.
 """
 
+import functools
+import io
 import os
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
 
 from backend.tools.base_tool import BaseTool
-from backend.tools.project import get_active_project_folder
+from backend.tools.project import get_active_project_folder, get_plan_path, get_project_dir, PLAN_FILES
 from backend.state_manager import NovelState, save_state, update_phase
+from backend.utils.file_cache import read_cached, prefetch
+from backend.utils.file_writer import count_words, write_parts
 from backend.config import Phase
 
 
+# Separator line used to frame loaded file content
+_SEP = "=" * 80
+
+# Markdown headings that open a chunk's section in the outline, e.g. "## Chunk 3"
+_CHUNK_HEADING_RE = re.compile(r'^#{1,4}\s*Chunk\s+(\d+)\b', re.MULTILINE | re.IGNORECASE)
+
+# Manuscript file names for common chunk numbers, formatted once
+_CHUNK_FILENAMES = [f"chunk_{i:02d}.md" for i in range(256)]
+
+# Shared pool for reading several independent files concurrently. Tools run
+# synchronously inside the agent's event loop, so threads (not asyncio.run)
+# are used to overlap the reads
+_read_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="file-read")
+
+
+def _chunk_filename(chunk_number: int) -> str:
+    """
+    Manuscript file name for a chunk.
+
+    Args:
+        chunk_number: Chunk number (1-indexed)
+
+    Returns:
+        File name such as chunk_01.md
+    """
+    if 0 <= chunk_number < len(_CHUNK_FILENAMES):
+        return _CHUNK_FILENAMES[chunk_number]
+    return f"chunk_{chunk_number:02d}.md"
+
+
+@functools.lru_cache(maxsize=16)
+def _outline_sections(outline_content: str) -> Dict[int, str]:
+    """
+    Split an outline into per-chunk sections at its "Chunk N" headings.
+
+    Memoized per outline text; the file cache returns the same str object
+    while outline.md is unchanged, so repeat lookups don't rescan it.
+
+    Args:
+        outline_content: Full outline markdown
+
+    Returns:
+        Mapping of chunk number to its section (empty if no chunk headings)
+    """
+    matches = list(_CHUNK_HEADING_RE.finditer(outline_content))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(outline_content)
+        sections.setdefault(int(match.group(1)), outline_content[match.start():end].rstrip())
+    return sections
+
+
+def _outline_excerpt(outline_content: str, chunk_number: int) -> Optional[str]:
+    """
+    Get the outline sections for a chunk and the chunks either side of it.
+
+    Args:
+        outline_content: Full outline markdown
+        chunk_number: Chunk number (1-indexed)
+
+    Returns:
+        The excerpt, or None if the outline has no section for this chunk
+    """
+    sections = _outline_sections(outline_content)
+    if chunk_number not in sections:
+        return None
+    return "\n\n".join(
+        sections[n] for n in (chunk_number - 1, chunk_number, chunk_number + 1)
+        if n in sections
+    )
+
+
+def _read_text(path: str) -> Optional[str]:
+    """
+    Read a UTF-8 text file through the file cache.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content, or None if the file doesn't exist
+    """
+    try:
+        return read_cached(path)
+    except FileNotFoundError:
+        return None
+
+
+def _read_many(paths: List[str]) -> List[Union[str, None, Exception]]:
+    """
+    Read several files concurrently, preserving order.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        Per path: the content, None if missing, or the exception raised
+    """
+    futures = [_read_pool.submit(_read_text, path) for path in paths]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
 class LoadApprovedPlanTool(BaseTool):
     """Tool for loading the approved plan materials."""
 
@@ -51,38 +165,30 @@ to refresh your memory before writing. Use this at the start of writing or when
                 "message": "Error: No active project folder."
             }
 
-        files_to_load = {
-            'summary': 'planning/summary.md',
-            'characters': 'planning/characters.md',
-            'structure': 'planning/structure.md',
-            'outline': 'planning/outline.md'
-        }
-
+        # Read the four planning documents concurrently
+        keys = list(PLAN_FILES)
         loaded_content = {}
-        for key, rel_path in files_to_load.items():
-            file_path = os.path.join(project_folder, rel_path)
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        loaded_content[key] = f.read()
-                except Exception as e:
-                    loaded_content[key] = f"Error reading file: {str(e)}"
+        for key, result in zip(keys, _read_many([get_plan_path(key) for key in keys])):
+            if isinstance(result, Exception):
+                loaded_content[key] = f"Error reading file: {str(result)}"
+            elif result is not None:
+                loaded_content[key] = result
 
         formatted_content = f"""APPROVED PLAN - REFERENCE FOR WRITING:
 
-{'='*80}
+{_SEP}
 {loaded_content.get('summary', 'Summary not found')}
 
-{'='*80}
+{_SEP}
 {loaded_content.get('characters', 'Characters not found')}
 
-{'='*80}
+{_SEP}
 {loaded_content.get('structure', 'Structure not found')}
 
-{'='*80}
+{_SEP}
 {loaded_content.get('outline', 'Outline not found')}
 
-{'='*80}
+{_SEP}
 """
 
         return {
@@ -140,16 +246,27 @@ Use this to see what should happen in the chunk you're about to write."""
             }
 
         # Load outline
-        outline_path = os.path.join(project_folder, "planning", "outline.md")
-        if not os.path.exists(outline_path):
+        try:
+            outline_content = read_cached(get_plan_path("outline"))
+        except FileNotFoundError:
             return {
                 "success": False,
                 "message": "Outline file not found."
             }
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error loading context: {str(e)}"
+            }
 
         try:
-            with open(outline_path, 'r', encoding='utf-8') as f:
-                outline_content = f.read()
+            # Only the chunk's own outline section and its neighbors are sent;
+            # fall back to the full outline if it has no per-chunk headings
+            excerpt = _outline_excerpt(outline_content, chunk_number)
+            if excerpt is not None:
+                outline_text = f"Outline for Chunk {chunk_number} (with adjacent chunks):\n{excerpt}"
+            else:
+                outline_text = f"Full outline for reference:\n{outline_content}"
 
             # Update state
             if state:
@@ -163,8 +280,7 @@ Use this to see what should happen in the chunk you're about to write."""
                 "message": f"Context loaded for Chunk {chunk_number}",
                 "content": f"""CHUNK {chunk_number} CONTEXT:
 
-Full outline for reference:
-{outline_content}
+{outline_text}
 
 NOTE: Focus on the section for Chunk {chunk_number} when writing.
 """,
@@ -232,17 +348,14 @@ fully developed with scenes, dialogue, and description. Creates the file in the
             }
 
         # Format chunk filename
-        filename = f"chunk_{chunk_number:02d}.md"
-        file_path = os.path.join(project_folder, "manuscript", filename)
+        filename = _chunk_filename(chunk_number)
+        file_path = os.path.join(get_project_dir("manuscript"), filename)
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# Chunk {chunk_number}\n\n")
-                f.write(content)
-                f.write("\n")
+            write_parts(file_path, [f"# Chunk {chunk_number}\n\n", content, "\n"])
 
-            word_count = len(content.split())
+            word_count = count_words(content)
 
             return {
                 "success": True,
@@ -308,7 +421,7 @@ Use this to maintain consistency in voice, plot, and character development."""
                 "message": "Error: No active project folder."
             }
 
-        manuscript_dir = os.path.join(project_folder, "manuscript")
+        manuscript_dir = get_project_dir("manuscript")
         if not os.path.exists(manuscript_dir):
             return {
                 "success": False,
@@ -318,16 +431,18 @@ Use this to maintain consistency in voice, plot, and character development."""
         # Parse chunk range
         chunks_to_load = []
         if chunk_range.lower() == 'all':
-            # Load all chunks
-            for file in sorted(os.listdir(manuscript_dir)):
-                if file.startswith('chunk_') and file.endswith('.md'):
-                    chunks_to_load.append(file)
+            # Load all chunks (one directory read; names only, no per-file stat)
+            with os.scandir(manuscript_dir) as entries:
+                chunks_to_load = sorted(
+                    entry.name for entry in entries
+                    if entry.name.startswith('chunk_') and entry.name.endswith('.md')
+                )
         elif '-' in chunk_range:
             # Range like "1-3"
             try:
                 start, end = map(int, chunk_range.split('-'))
                 for i in range(start, end + 1):
-                    chunks_to_load.append(f"chunk_{i:02d}.md")
+                    chunks_to_load.append(_chunk_filename(i))
             except:
                 return {
                     "success": False,
@@ -337,45 +452,48 @@ Use this to maintain consistency in voice, plot, and character development."""
             # Single chunk
             try:
                 num = int(chunk_range)
-                chunks_to_load.append(f"chunk_{num:02d}.md")
+                chunks_to_load.append(_chunk_filename(num))
             except:
                 return {
                     "success": False,
                     "message": f"Invalid chunk number: {chunk_range}"
                 }
 
-        # Load chunks
-        loaded_chunks = []
-        for filename in chunks_to_load:
-            file_path = os.path.join(manuscript_dir, filename)
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        loaded_chunks.append(f"\n{'='*80}\n{filename}\n{'='*80}\n{content}")
-                except Exception as e:
-                    loaded_chunks.append(f"\nError loading {filename}: {str(e)}")
-
-        if not loaded_chunks:
+        # Load chunks concurrently (missing chunks are skipped). For several
+        # chunks, queue kernel readahead for all of them before reading
+        paths = [os.path.join(manuscript_dir, filename) for filename in chunks_to_load]
+        if len(paths) > 1:
+            prefetch(paths)
+        results = _read_many(paths)
+
+        # Frame each chunk straight into one buffer
+        buf = io.StringIO()
+        buf.write("PREVIOUS CHUNKS FOR REVIEW:\n\n")
+        chunks_loaded = 0
+        for filename, result in zip(chunks_to_load, results):
+            if isinstance(result, Exception):
+                buf.write(f"\nError loading {filename}: {str(result)}")
+            elif result is not None:
+                buf.write(f"\n{_SEP}\n{filename}\n{_SEP}\n")
+                buf.write(result)
+            else:
+                continue
+            chunks_loaded += 1
+
+        if not chunks_loaded:
             return {
                 "success": False,
                 "message": f"No chunks found for range: {chunk_range}"
             }
 
-        formatted_content = f"""PREVIOUS CHUNKS FOR REVIEW:
-
-{''.join(loaded_chunks)}
-
-{'='*80}
-END OF PREVIOUS CHUNKS
-{'='*80}
-"""
+        buf.write(f"\n\n{_SEP}\nEND OF PREVIOUS CHUNKS\n{_SEP}\n")
+        formatted_content = buf.getvalue()
 
         return {
             "success": True,
-            "message": f"Loaded {len(loaded_chunks)} chunk(s) for review.",
+            "message": f"Loaded {chunks_loaded} chunk(s) for review.",
             "content": formatted_content,
-            "chunks_loaded": len(loaded_chunks)
+            "chunks_loaded": chunks_loaded
         }
 
 
@@ -433,8 +551,8 @@ This transitions to the write critique phase for this specific chunk."""
             }
 
         # Verify chunk exists
-        filename = f"chunk_{chunk_number:02d}.md"
-        file_path = os.path.join(project_folder, "manuscript", filename)
+        filename = _chunk_filename(chunk_number)
+        file_path = os.path.join(get_project_dir("manuscript"), filename)
 
         if not os.path.exists(file_path):
             return {
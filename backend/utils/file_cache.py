@@ -0,0 +1,96 @@
+"""
+In-memory cache for project file reads.
+
+Planning documents and manuscript chunks are read far more often than they
+are written. Cached content is validated against the file's stat signature
+(mtime, size, inode) on every read, so a rewritten file is always re-read;
+writers also invalidate the paths they replace.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+# Maximum number of files held in memory (least recently used evicted first)
+_MAX_ENTRIES = 128
+
+_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], str]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def read_cached(file_path: str, st: Optional[os.stat_result] = None) -> str:
+    """
+    Read a UTF-8 file, reusing the cached content while the file is unchanged.
+
+    Args:
+        file_path: File to read
+        st: Result of os.stat(file_path) if the caller already has it
+
+    Returns:
+        File content
+
+    Raises:
+        OSError: If the file doesn't exist or can't be read
+        UnicodeDecodeError: If the file isn't valid UTF-8
+    """
+    if st is None:
+        st = os.stat(file_path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _lock:
+        entry = _cache.get(file_path)
+        if entry is not None and entry[0] == signature:
+            _cache.move_to_end(file_path)
+            return entry[1]
+
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8')
+
+    with _lock:
+        _cache[file_path] = (signature, content)
+        _cache.move_to_end(file_path)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return content
+
+
+def invalidate(file_path: str) -> None:
+    """
+    Drop a file from the cache after it has been written.
+
+    Args:
+        file_path: File that was written
+    """
+    with _lock:
+        _cache.pop(file_path, None)
+
+
+def prefetch(paths: List[str]) -> None:
+    """
+    Ask the kernel to start reading files into the page cache ahead of use.
+
+    Files already held in this cache are skipped, as are missing files. This
+    is a hint only; it is a no-op on platforms without posix_fadvise.
+
+    Args:
+        paths: Files about to be read
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for path in paths:
+        if path in _cache:
+            continue
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
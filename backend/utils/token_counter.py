@@ -4,8 +4,194 @@ Token counting utilities for the Kimi Multi-Agent Novel Writing System.
 This module provides token estimation using the Moonshot AI API.
 """
 
+import asyncio
+import atexit
+import json
+import threading
+
 import httpx
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Long-lived HTTP clients per (base_url, api_key), so token estimation reuses
+# pooled keep-alive connections instead of a new TCP/TLS handshake per call
+_CLIENT_TIMEOUT = 30.0
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+
+_clients: Dict[Tuple[str, str], httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+# Async clients are bound to the event loop that created them
+_async_clients: Dict[Tuple[str, str], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _get_client(base_url: str, api_key: str) -> httpx.Client:
+    """
+    Get the shared sync client for an endpoint, creating it on first use.
+
+    Args:
+        base_url: The base URL for the API
+        api_key: The API key for authentication
+
+    Returns:
+        Pooled HTTP client
+    """
+    key = (base_url, api_key)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = httpx.Client(
+                    base_url=base_url,
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=_CLIENT_TIMEOUT,
+                    limits=_CLIENT_LIMITS
+                )
+                _clients[key] = client
+    return client
+
+
+def _get_async_client(base_url: str, api_key: str) -> httpx.AsyncClient:
+    """
+    Get the shared async client for an endpoint on the running event loop.
+
+    A client created on a different loop is replaced. If that loop is still
+    running, the old client is closed there. A loop that has stopped can no
+    longer run aclose(), so its client is dropped instead, and its sockets
+    are released when the client is garbage-collected. Async clients are not
+    closed at interpreter exit.
+
+    Args:
+        base_url: The base URL for the API
+        api_key: The API key for authentication
+
+    Returns:
+        Pooled async HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    key = (base_url, api_key)
+    entry = _async_clients.get(key)
+    if entry is None or entry[0] is not loop:
+        if entry is not None:
+            old_loop, old_client = entry
+            if old_loop.is_running() and not old_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+        entry = (loop, httpx.AsyncClient(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=_CLIENT_TIMEOUT,
+            limits=_CLIENT_LIMITS
+        ))
+        _async_clients[key] = entry
+    return entry[1]
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Message fields forwarded to the token endpoint (tool_calls are normalized
+# separately)
+_MSG_KEEP = ('role', 'content', 'name', 'tool_call_id')
+
+
+@atexit.register
+def _close_clients() -> None:
+    """
+    Close pooled sync clients at interpreter exit.
+
+    Async clients are left alone: the event loops they belong to have
+    normally finished by now, so aclose() could not run.
+    """
+    for client in _clients.values():
+        client.close()
+
+
+def _normalize_message(msg: Any) -> Dict[str, Any]:
+    """
+    Convert a message to a plain, JSON-serializable dictionary.
+
+    Args:
+        msg: Message dictionary, OpenAI SDK message object, or other value
+
+    Returns:
+        Message dictionary with only the fields the token endpoint accepts
+    """
+    if hasattr(msg, 'model_dump'):
+        # OpenAI SDK message object
+        msg_dict = msg.model_dump()
+    elif isinstance(msg, dict):
+        msg_dict = msg
+    else:
+        msg_dict = {"role": "assistant", "content": str(msg)}
+
+    # Clean up the message to only include serializable, non-empty fields
+    clean_msg = {key: value for key in _MSG_KEEP if (value := msg_dict.get(key))}
+
+    tool_calls = msg_dict.get('tool_calls')
+    if tool_calls:
+        # Ensure tool_calls are serializable dictionaries
+        clean_tool_calls = []
+        for tc in tool_calls:
+            if isinstance(tc, dict):
+                clean_tool_calls.append(tc)
+            elif hasattr(tc, 'model_dump'):
+                # OpenAI SDK tool call (pydantic); serialized by pydantic-core
+                clean_tool_calls.append(tc.model_dump())
+            elif hasattr(tc, '__dict__'):
+                # Convert object to dict
+                tc_dict = {
+                    'id': getattr(tc, 'id', None),
+                    'type': getattr(tc, 'type', 'function'),
+                    'function': {
+                        'name': getattr(tc.function, 'name', '') if hasattr(tc, 'function') else '',
+                        'arguments': getattr(tc.function, 'arguments', '') if hasattr(tc, 'function') else ''
+                    }
+                }
+                clean_tool_calls.append(tc_dict)
+        if clean_tool_calls:
+            clean_msg['tool_calls'] = clean_tool_calls
+
+    return clean_msg
+
+
+def _normalize_messages(messages: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert messages to serializable format (remove non-serializable objects).
+
+    Args:
+        messages: List of message dictionaries or SDK message objects
+
+    Returns:
+        List of plain message dictionaries
+    """
+    return [_normalize_message(msg) for msg in messages]
+
+
+def _encode_request(model: str, messages: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize the request body for the token estimation endpoint.
+
+    Args:
+        model: The model name
+        messages: Normalized message dictionaries
+
+    Returns:
+        JSON request body
+    """
+    payload = {
+        "model": model,
+        "messages": messages
+    }
+    if ORJSON_AVAILABLE:
+        # Serialize in C
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
 
 
 def estimate_token_count(
@@ -31,68 +217,23 @@ def estimate_token_count(
     Raises:
         httpx.HTTPStatusError: If API request fails
     """
-    # Convert messages to serializable format (remove non-serializable objects)
-    serializable_messages = []
-    for msg in messages:
-        if hasattr(msg, 'model_dump'):
-            # OpenAI SDK message object
-            msg_dict = msg.model_dump()
-        elif isinstance(msg, dict):
-            msg_dict = msg.copy()
-        else:
-            msg_dict = {"role": "assistant", "content": str(msg)}
-
-        # Clean up the message to only include serializable fields
-        clean_msg = {}
-        if 'role' in msg_dict:
-            clean_msg['role'] = msg_dict['role']
-        if 'content' in msg_dict and msg_dict['content']:
-            clean_msg['content'] = msg_dict['content']
-        if 'name' in msg_dict:
-            clean_msg['name'] = msg_dict['name']
-        if 'tool_calls' in msg_dict and msg_dict['tool_calls']:
-            # Ensure tool_calls are serializable dictionaries
-            clean_tool_calls = []
-            for tc in msg_dict['tool_calls']:
-                if isinstance(tc, dict):
-                    clean_tool_calls.append(tc)
-                elif hasattr(tc, '__dict__'):
-                    # Convert object to dict
-                    tc_dict = {
-                        'id': getattr(tc, 'id', None),
-                        'type': getattr(tc, 'type', 'function'),
-                        'function': {
-                            'name': getattr(tc.function, 'name', '') if hasattr(tc, 'function') else '',
-                            'arguments': getattr(tc.function, 'arguments', '') if hasattr(tc, 'function') else ''
-                        }
-                    }
-                    clean_tool_calls.append(tc_dict)
-            if clean_tool_calls:
-                clean_msg['tool_calls'] = clean_tool_calls
-        if 'tool_call_id' in msg_dict:
-            clean_msg['tool_call_id'] = msg_dict['tool_call_id']
-
-        serializable_messages.append(clean_msg)
+    serializable_messages = _normalize_messages(messages)
 
     # Both token estimation and chat use api.moonshot.ai
     token_base_url = base_url
 
+    body = _encode_request(model, serializable_messages)
+
     # Make the API call
-    with httpx.Client(
-        base_url=token_base_url,
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=30.0
-    ) as client:
-        response = client.post(
-            "/tokenizers/estimate-token-count",
-            json={
-                "model": model,
-                "messages": serializable_messages
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("total_tokens", 0)
+    client = _get_client(token_base_url, api_key)
+    response = client.post(
+        "/tokenizers/estimate-token-count",
+        content=body,
+        headers=_JSON_HEADERS
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data.get("data", {}).get("total_tokens", 0)
 
 
 def estimate_token_count_simple(messages: List[Dict]) -> int:
@@ -159,64 +300,22 @@ async def estimate_token_count_async(
     # For non-Moonshot models, use simple approximation
     if not is_moonshot:
         return estimate_token_count_simple(messages)
-    # Convert messages to serializable format
-    serializable_messages = []
-    for msg in messages:
-        if hasattr(msg, 'model_dump'):
-            msg_dict = msg.model_dump()
-        elif isinstance(msg, dict):
-            msg_dict = msg.copy()
-        else:
-            msg_dict = {"role": "assistant", "content": str(msg)}
-
-        clean_msg = {}
-        if 'role' in msg_dict:
-            clean_msg['role'] = msg_dict['role']
-        if 'content' in msg_dict and msg_dict['content']:
-            clean_msg['content'] = msg_dict['content']
-        if 'name' in msg_dict:
-            clean_msg['name'] = msg_dict['name']
-        if 'tool_calls' in msg_dict and msg_dict['tool_calls']:
-            # Ensure tool_calls are serializable dictionaries
-            clean_tool_calls = []
-            for tc in msg_dict['tool_calls']:
-                if isinstance(tc, dict):
-                    clean_tool_calls.append(tc)
-                elif hasattr(tc, '__dict__'):
-                    # Convert object to dict
-                    tc_dict = {
-                        'id': getattr(tc, 'id', None),
-                        'type': getattr(tc, 'type', 'function'),
-                        'function': {
-                            'name': getattr(tc.function, 'name', '') if hasattr(tc, 'function') else '',
-                            'arguments': getattr(tc.function, 'arguments', '') if hasattr(tc, 'function') else ''
-                        }
-                    }
-                    clean_tool_calls.append(tc_dict)
-            if clean_tool_calls:
-                clean_msg['tool_calls'] = clean_tool_calls
-        if 'tool_call_id' in msg_dict:
-            clean_msg['tool_call_id'] = msg_dict['tool_call_id']
 
-        serializable_messages.append(clean_msg)
+    serializable_messages = _normalize_messages(messages)
 
     token_base_url = base_url
 
-    async with httpx.AsyncClient(
-        base_url=token_base_url,
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=30.0
-    ) as client:
-        response = await client.post(
-            "/tokenizers/estimate-token-count",
-            json={
-                "model": model,
-                "messages": serializable_messages
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("total_tokens", 0)
+    body = _encode_request(model, serializable_messages)
+
+    client = _get_async_client(token_base_url, api_key)
+    response = await client.post(
+        "/tokenizers/estimate-token-count",
+        content=body,
+        headers=_JSON_HEADERS
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data.get("data", {}).get("total_tokens", 0)
 
 
 def should_compress(
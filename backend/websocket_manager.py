@@ -11,9 +11,33 @@ from typing import Dict, Set, Any, Optional
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _encode_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a message to JSON text for a WebSocket frame.
+
+    Args:
+        message: Message dictionary
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # Types orjson doesn't handle; let json report or encode them
+    return json.dumps(message)
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections and broadcasts updates to connected clients.
@@ -86,10 +110,13 @@ class WebSocketManager:
         # Get connections (copy to avoid modification during iteration)
         connections = self.connections[project_id].copy()
 
+        # Serialize once for all connections
+        text = _encode_message(message)
+
         # Send to all connections
         for websocket in connections:
             try:
-                await self._send_to_websocket(websocket, message)
+                await websocket.send_text(text)
             except Exception as e:
                 logger.error(f"Error sending to websocket: {e}")
                 # Remove failed connection
@@ -103,7 +130,7 @@ class WebSocketManager:
             websocket: WebSocket connection
             message: Message to send
         """
-        await websocket.send_text(json.dumps(message))
+        await websocket.send_text(_encode_message(message))
 
     # Convenience methods for common message types
 
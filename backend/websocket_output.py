@@ -5,12 +5,22 @@ This module wraps the existing WebSocketManager to implement the OutputHandler i
 maintaining backward compatibility with the web UI.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 from backend.output_handler import OutputHandler
 from backend.websocket_manager import WebSocketManager
 
 
+# Streamed tokens arriving within this window (seconds) are coalesced into a
+# single WebSocket frame
+STREAM_FLUSH_INTERVAL = 0.016
+
+# Buffered stream content (characters) that forces a flush regardless of time
+STREAM_FLUSH_MAX_CHARS = 2048
+
+
 class WebSocketOutputHandler(OutputHandler):
     """
     WebSocket-based output handler.
@@ -30,28 +40,87 @@ class WebSocketOutputHandler(OutputHandler):
         self.ws_manager = ws_manager
         self.project_id = project_id
 
+        # Buffered stream chunks as (project_id, content, is_reasoning)
+        self._pending: List[Tuple[str, str, bool]] = []
+        self._pending_chars = 0
+        self._last_flush = 0.0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def _schedule_flush(self):
+        """Timer callback: flush a trailing burst of buffered stream chunks."""
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self._flush_stream())
+
+    async def _flush_stream(self):
+        """
+        Send buffered stream chunks, merging consecutive chunks of the same kind.
+
+        Every other message type flushes first, so clients still see events
+        in the order they were produced.
+        """
+        async with self._flush_lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+
+            pending, self._pending = self._pending, []
+            self._pending_chars = 0
+            self._last_flush = time.monotonic()
+            i = 0
+            while i < len(pending):
+                project_id, _, is_reasoning = pending[i]
+                j = i + 1
+                while j < len(pending) and pending[j][0] == project_id and pending[j][2] == is_reasoning:
+                    j += 1
+                content = ''.join(item[1] for item in pending[i:j])
+                await self.ws_manager.send_stream_chunk(project_id, content, is_reasoning)
+                i = j
+
     async def send_phase_change(self, project_id: str, from_phase: str, to_phase: str):
         """Notify clients of phase transition."""
+        await self._flush_stream()
         await self.ws_manager.send_phase_change(project_id, from_phase, to_phase)
 
     async def send_stream_chunk(self, project_id: str, content: str, is_reasoning: bool = False):
-        """Send streaming content chunk."""
-        await self.ws_manager.send_stream_chunk(project_id, content, is_reasoning)
+        """
+        Buffer a streaming content chunk; it is sent with its neighbours.
+
+        The flush happens here, awaited, once the interval has elapsed or the
+        buffer is full. The agent loop reads the model stream synchronously,
+        so a timer alone would not fire until the whole response had been
+        read; the timer only covers a trailing partial burst.
+        """
+        self._pending.append((project_id, content, is_reasoning))
+        self._pending_chars += len(content)
+        if (
+            time.monotonic() - self._last_flush >= STREAM_FLUSH_INTERVAL
+            or self._pending_chars >= STREAM_FLUSH_MAX_CHARS
+        ):
+            await self._flush_stream()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(STREAM_FLUSH_INTERVAL, self._schedule_flush)
 
     async def send_tool_call(self, project_id: str, tool_name: str, arguments: Dict[str, Any]):
         """Notify clients of tool execution."""
+        await self._flush_stream()
         await self.ws_manager.send_tool_call(project_id, tool_name, arguments)
 
     async def send_tool_result(self, project_id: str, tool_name: str, result: Dict[str, Any]):
         """Send tool execution result."""
+        await self._flush_stream()
         await self.ws_manager.send_tool_result(project_id, tool_name, result)
 
     async def send_token_update(self, project_id: str, token_count: int, token_limit: int):
         """Send token usage update."""
+        await self._flush_stream()
         await self.ws_manager.send_token_update(project_id, token_count, token_limit)
 
     async def request_approval(self, project_id: str, approval_type: str, data: Dict[str, Any]):
         """Request user approval for checkpoint."""
+        await self._flush_stream()
         await self.ws_manager.request_approval(project_id, approval_type, data)
 
     async def send_progress(
@@ -62,6 +131,7 @@ class WebSocketOutputHandler(OutputHandler):
         details: Optional[Dict[str, Any]] = None
     ):
         """Send progress update."""
+        await self._flush_stream()
         await self.ws_manager.send_progress(project_id, percentage, message, details)
 
     async def send_error(
@@ -71,8 +141,10 @@ class WebSocketOutputHandler(OutputHandler):
         error_type: Optional[str] = None
     ):
         """Send error notification."""
+        await self._flush_stream()
         await self.ws_manager.send_error(project_id, error_message, error_type)
 
     async def send_completion(self, project_id: str, stats: Dict[str, Any]):
         """Send novel completion notification."""
+        await self._flush_stream()
         await self.ws_manager.send_completion(project_id, stats)